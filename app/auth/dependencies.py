@@ -7,11 +7,13 @@ from app.models.user import User
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
 
-def get_current_user(
+async def get_current_user(
     token: str = Depends(oauth2_scheme)
 ) -> UserResponse:
     """
     Dependency to get the current user from the JWT token without a database lookup.
+    It only decodes the token (no I/O), so it runs on the event loop rather
+    than costing async handlers a threadpool hop.
     This function supports two types of payloads:
       - A full payload as a dict containing user info.
       - A minimal payload, either as a dict with only a 'sub' key or directly as a UUID.
@@ -67,7 +69,7 @@ def get_current_user(
     except Exception:
         raise credentials_exception
 
-def get_current_active_user(
+async def get_current_active_user(
     current_user: UserResponse = Depends(get_current_user)
 ) -> UserResponse:
     """
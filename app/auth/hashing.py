@@ -0,0 +1,103 @@
+# app/auth/hashing.py
+"""
+Password hashing on a process pool.
+
+bcrypt is deliberately CPU-heavy. pyca/bcrypt releases the GIL while
+hashing, but passlib's os_crypt fallback (used when the bcrypt package is
+not installed) holds it for the whole hash. The pool keeps either backend
+off the request threads and caps how many hashes each uvicorn worker runs
+at once, so a burst of logins cannot take every core away from request
+handling. The calling thread just waits on the result.
+
+If a child dies the pool is discarded, the call is retried in-process and
+the next call starts a fresh pool.
+
+Workers are spawned (not forked) so they never inherit the parent's threads
+or open database connections. Spawned children still re-import the
+parent's __main__ module (app.main under `python -m app.main`) along with
+this one, so entry points must keep their startup under a __main__ guard.
+"""
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from passlib.context import CryptContext
+
+from app.core.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=settings.BCRYPT_ROUNDS
+)
+
+_hash_pool: Optional[ProcessPoolExecutor] = None
+_hash_pool_lock = threading.Lock()
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+def get_hash_workers() -> int:
+    """Hashing processes per uvicorn worker: this worker's share of the CPUs."""
+    if settings.PASSWORD_HASH_WORKERS is not None:
+        return settings.PASSWORD_HASH_WORKERS
+    return max((os.cpu_count() or 1) // max(settings.WEB_CONCURRENCY, 1), 1)
+
+def get_hash_pool() -> Optional[ProcessPoolExecutor]:
+    """Return the shared hashing pool, or None when PASSWORD_HASH_WORKERS is 0."""
+    global _hash_pool
+    max_workers = get_hash_workers()
+    if max_workers == 0:
+        return None
+    with _hash_pool_lock:
+        if _hash_pool is None:
+            _hash_pool = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _hash_pool
+
+def _discard_hash_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call builds a new one."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is pool:
+            _hash_pool = None
+    pool.shutdown(wait=False)
+
+def _run(fn, *args):
+    pool = get_hash_pool()
+    if pool is None:
+        return fn(*args)
+    try:
+        return pool.submit(fn, *args).result()
+    except BrokenProcessPool:
+        logger.warning("Password hashing pool broke; restarting it")
+        _discard_hash_pool(pool)
+        return fn(*args)
+
+def shutdown_hash_pool() -> None:
+    """Stop the hashing workers (called on application shutdown)."""
+    global _hash_pool
+    with _hash_pool_lock:
+        if _hash_pool is not None:
+            _hash_pool.shutdown()
+            _hash_pool = None
+
+def hash_password(password: str) -> str:
+    """Hash a password with bcrypt on the hashing pool."""
+    return _run(_hash, password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its bcrypt hash on the hashing pool."""
+    return _run(_verify, plain_password, hashed_password)
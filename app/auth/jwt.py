@@ -2,13 +2,13 @@
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional, Union
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from fastapi import HTTPException, status, Depends
 from fastapi.security import OAuth2PasswordBearer
 from uuid import UUID
 import secrets
 
 from app.core.config import get_settings
+from app.auth import hashing
 from app.auth.redis import add_to_blacklist, is_blacklisted
 from app.schemas.token import TokenType
 from app.database import get_db
@@ -17,22 +17,15 @@ from app.models.user import User
 
 settings = get_settings()
 
-# Password hashing
-pwd_context = CryptContext(
-    schemes=["bcrypt"],
-    deprecated="auto",
-    bcrypt__rounds=settings.BCRYPT_ROUNDS
-)
-
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a plain password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    """Verify a plain password against its hash (on the hashing pool)."""
+    return hashing.verify_password(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
-    """Hash a password using bcrypt."""
-    return pwd_context.hash(password)
+    """Hash a password using bcrypt (on the hashing pool)."""
+    return hashing.hash_password(password)
 
 def create_token(
     user_id: Union[str, UUID],
@@ -9,7 +9,9 @@ async def get_redis():
         get_redis.redis = redis.from_url(
             settings.REDIS_URL or "redis://localhost",
             encoding="utf-8",
-            decode_responses=True
+            decode_responses=True,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
         )
     return get_redis.redis
 
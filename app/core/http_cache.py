@@ -0,0 +1,29 @@
+# app/core/http_cache.py
+"""
+Helpers for HTTP conditional requests (ETag / If-None-Match).
+
+ETags are weak (W/"...") because GZipMiddleware may re-encode the body;
+the representation is semantically the same either way.
+"""
+import hashlib
+
+from fastapi import Request
+
+
+def make_etag(body: bytes) -> str:
+    """Weak ETag derived from a response body."""
+    return f'W/"{hashlib.md5(body, usedforsecurity=False).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if the request's If-None-Match header matches the given ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in header.split(",")
+    )
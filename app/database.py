@@ -1,15 +1,71 @@
 # app/database.py
+from typing import AsyncGenerator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.core.config import settings
 
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
+# Async drivers used for each sync dialect in DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_database_url(database_url: str = SQLALCHEMY_DATABASE_URL) -> str:
+    """Translate a sync DATABASE_URL into its async-driver equivalent."""
+    url = make_url(database_url)
+    drivername = ASYNC_DRIVERS.get(url.get_backend_name(), url.drivername)
+    return url.set(drivername=drivername).render_as_string(hide_password=False)
+
+def get_pool_sizes() -> tuple:
+    """
+    (sync, async) pool_size for this worker: its share of
+    DB_MAX_CONNECTIONS, a quarter to the sync engine, unless overridden.
+    """
+    per_worker = max(settings.DB_MAX_CONNECTIONS // max(settings.WEB_CONCURRENCY, 1), 2)
+    sync_size = settings.DB_POOL_SIZE
+    if sync_size is None:
+        sync_size = max(per_worker // 4, 1)
+    async_size = settings.DB_ASYNC_POOL_SIZE
+    if async_size is None:
+        async_size = max(per_worker - sync_size, 1)
+    return sync_size, async_size
+
+def get_pool_options(pool_size: int, max_overflow: int) -> dict:
+    """Engine keyword arguments for a connection pool of the given size."""
+    if settings.DB_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+SYNC_POOL_SIZE, ASYNC_POOL_SIZE = get_pool_sizes()
+
 # Create the default engine and sessionmaker
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL,
+    **get_pool_options(SYNC_POOL_SIZE, settings.DB_MAX_OVERFLOW),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and sessionmaker for the non-blocking (async def) endpoints
+async_engine = create_async_engine(
+    get_async_database_url(),
+    **get_pool_options(ASYNC_POOL_SIZE, settings.DB_ASYNC_MAX_OVERFLOW),
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 def get_db():
@@ -19,6 +75,10 @@ def get_db():
     finally:
         db.close()
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with AsyncSessionLocal() as db:
+        yield db
+
 # --- New Functions Added ---
 def get_engine(database_url: str = SQLALCHEMY_DATABASE_URL):
     """Factory function to create a new SQLAlchemy engine."""
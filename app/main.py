@@ -10,35 +10,49 @@ This module defines the main FastAPI application, including:
 - Database table creation on startup
 """
 
+import base64
+import binascii
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone, timedelta
+from email.utils import format_datetime
 from uuid import UUID
-from typing import List
+from typing import Optional
 
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+from fastapi import FastAPI, Depends, HTTPException, Query, status, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.security import OAuth2PasswordRequestForm
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from anyio import to_thread
+from sqlalchemy import select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 import uvicorn
 
 # Application imports
-from app.database import Base, get_db, engine
+from app.core.config import get_settings
+from app.core.http_cache import etag_matches, make_etag
+from app.database import Base, get_db, get_async_db, engine, async_engine
 from app.auth.dependencies import get_current_active_user
+from app.auth.hashing import shutdown_hash_pool
 from app.models.user import User
 from app.models.calculation import Calculation
 from app.schemas.user import UserCreate, UserResponse, UserLogin
 from app.schemas.token import TokenResponse
 from app.schemas.calculation import (
     CalculationBase,
+    CalculationPage,
     CalculationResponse,
     CalculationUpdate,
 )
 
 # 🔹 NEW: Report routes
 from app.routes import reports
+from app.routes.reports import invalidate_usage_report
+
+settings = get_settings()
 
 
 # ------------------------------------------------------------------------------
@@ -49,7 +63,14 @@ async def lifespan(app: FastAPI):
     print("Creating tables...")
     Base.metadata.create_all(bind=engine)
     print("Tables created successfully!")
+    # Raise AnyIO's default 40-thread limit for the sync handlers
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_TOKENS
+    # Compile every template once so requests only hit the template cache
+    for name in templates.env.list_templates():
+        templates.env.get_template(name)
     yield
+    shutdown_hash_pool()
+    await async_engine.dispose()
 
 
 # ------------------------------------------------------------------------------
@@ -60,41 +81,77 @@ app = FastAPI(
     description="API for managing calculations with history reporting",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Compress larger responses (calculation lists, pages); tiny JSON bodies
+# are not worth the CPU.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Register routers
 app.include_router(reports.router)
 
 # Static files & templates
 app.mount("/static", StaticFiles(directory="static"), name="static")
 templates = Jinja2Templates(directory="templates")
+# Templates only change on deploy; skip the per-render mtime check.
+templates.env.auto_reload = False
 
 
 # ------------------------------------------------------------------------------
 # Web Routes
 # ------------------------------------------------------------------------------
+# Pages with no per-request context are rendered once per base URL (the
+# layout's url_for() links are absolute) and then served from memory with
+# an ETag. Host is client-controlled, so the number of entries is capped.
+STATIC_PAGE_CACHE_CONTROL = "public, max-age=300"
+STATIC_PAGE_CACHE_SIZE = 32
+STATIC_PAGES_MODIFIED = format_datetime(datetime.now(timezone.utc), usegmt=True)
+_static_pages: dict = {}
+
+
+def static_page(request: Request, name: str) -> Response:
+    key = (name, str(request.base_url))
+    page = _static_pages.get(key)
+    if page is None:
+        body = templates.TemplateResponse(name, {"request": request}).body
+        page = (body, make_etag(body))
+        if len(_static_pages) < STATIC_PAGE_CACHE_SIZE:
+            _static_pages[key] = page
+    body, etag = page
+
+    headers = {
+        "ETag": etag,
+        "Last-Modified": STATIC_PAGES_MODIFIED,
+        "Cache-Control": STATIC_PAGE_CACHE_CONTROL,
+    }
+    if etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return HTMLResponse(body, headers=headers)
+
+
 @app.get("/", response_class=HTMLResponse, tags=["web"])
-def read_index(request: Request):
-    return templates.TemplateResponse("index.html", {"request": request})
+async def read_index(request: Request):
+    return static_page(request, "index.html")
 
 
 @app.get("/login", response_class=HTMLResponse, tags=["web"])
-def login_page(request: Request):
-    return templates.TemplateResponse("login.html", {"request": request})
+async def login_page(request: Request):
+    return static_page(request, "login.html")
 
 
 @app.get("/register", response_class=HTMLResponse, tags=["web"])
-def register_page(request: Request):
-    return templates.TemplateResponse("register.html", {"request": request})
+async def register_page(request: Request):
+    return static_page(request, "register.html")
 
 
 @app.get("/dashboard", response_class=HTMLResponse, tags=["web"])
-def dashboard(request: Request):
-    return templates.TemplateResponse("dashboard.html", {"request": request})
+async def dashboard(request: Request):
+    return static_page(request, "dashboard.html")
 
 
 @app.get("/dashboard/view/{calc_id}", response_class=HTMLResponse, tags=["web"])
-def view_calc(request: Request, calc_id: str):
+async def view_calc(request: Request, calc_id: str):
     return templates.TemplateResponse(
         "view_calculation.html",
         {"request": request, "calc_id": calc_id},
@@ -102,7 +159,7 @@ def view_calc(request: Request, calc_id: str):
 
 
 @app.get("/dashboard/edit/{calc_id}", response_class=HTMLResponse, tags=["web"])
-def edit_calc(request: Request, calc_id: str):
+async def edit_calc(request: Request, calc_id: str):
     return templates.TemplateResponse(
         "edit_calculation.html",
         {"request": request, "calc_id": calc_id},
@@ -129,11 +186,15 @@ def health():
 def register_user(user_create: UserCreate, db: Session = Depends(get_db)):
     try:
         user = User.register(
-            db, user_create.dict(exclude={"confirm_password"})
+            db, user_create.model_dump(exclude={"confirm_password"})
         )
+        # Every response field is set in Python (explicitly or by column
+        # defaults at flush), so build the response before commit expires
+        # the instance rather than re-reading the row with refresh().
+        db.flush()
+        response = UserResponse.model_validate(user)
         db.commit()
-        db.refresh(user)
-        return user
+        return response
     except ValueError as e:
         db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
@@ -188,10 +249,10 @@ def login_form(
     status_code=status.HTTP_201_CREATED,
     tags=["calculations"],
 )
-def create_calculation(
+async def create_calculation(
     data: CalculationBase,
     current_user=Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     try:
         calc = Calculation.create(
@@ -199,32 +260,85 @@ def create_calculation(
             user_id=current_user.id,
             inputs=data.inputs,
         )
-        calc.result = calc.get_result()
 
+        # id and timestamps are Python-side defaults populated on flush, and
+        # the async session does not expire on commit, so no refresh SELECT.
         db.add(calc)
-        db.commit()
-        db.refresh(calc)
+        await db.commit()
+        await invalidate_usage_report(current_user.id)
         return calc
     except ValueError as e:
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=400, detail=str(e))
 
 
+def encode_cursor(created_at: datetime, calc_id: UUID) -> str:
+    """Opaque keyset cursor for the row (created_at, id)."""
+    raw = f"{created_at.isoformat()}|{calc_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Inverse of encode_cursor; raises 422 on anything it did not produce."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        created_at, _, calc_id = raw.rpartition("|")
+        created_at = datetime.fromisoformat(created_at)
+        calc_id = UUID(calc_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid cursor",
+        )
+    # created_at is stored as naive UTC
+    if created_at.tzinfo is not None:
+        created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+    return created_at, calc_id
+
+
 @app.get(
     "/calculations",
-    response_model=List[CalculationResponse],
+    response_model=CalculationPage,
     tags=["calculations"],
 )
-def list_calculations(
+async def list_calculations(
+    limit: int = Query(50, ge=1, le=200),
+    cursor: Optional[str] = Query(
+        None, description="next_cursor from the previous page"
+    ),
     current_user=Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    return (
-        db.query(Calculation)
-        .filter(Calculation.user_id == current_user.id)
-        .order_by(Calculation.created_at.desc())
-        .all()
-    )
+    # Keyset pagination: seek past the cursor instead of OFFSET, and fetch
+    # one extra row to learn whether another page exists. id breaks ties
+    # between rows sharing a created_at so none are skipped at a page
+    # boundary.
+    # Only the columns the history view renders, as plain rows (no ORM
+    # instances).
+    stmt = select(
+        Calculation.id,
+        Calculation.type,
+        Calculation.inputs,
+        Calculation.result,
+        Calculation.created_at,
+    ).where(Calculation.user_id == current_user.id)
+    if cursor is not None:
+        stmt = stmt.where(
+            tuple_(Calculation.created_at, Calculation.id) < tuple_(*decode_cursor(cursor))
+        )
+    stmt = stmt.order_by(
+        Calculation.created_at.desc(), Calculation.id.desc()
+    ).limit(limit + 1)
+
+    items = (await db.execute(stmt)).mappings().all()
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    last = items[-1] if has_more else None
+    return {
+        "items": items,
+        "next_cursor": encode_cursor(last["created_at"], last["id"]) if last else None,
+    }
 
 
 @app.get(
@@ -232,23 +346,16 @@ def list_calculations(
     response_model=CalculationResponse,
     tags=["calculations"],
 )
-def get_calculation(
-    calc_id: str,
+async def get_calculation(
+    calc_id: UUID,
     current_user=Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    try:
-        calc_uuid = UUID(calc_id)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Invalid ID")
-
-    calc = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == calc_uuid,
+    calc = await db.scalar(
+        select(Calculation).where(
+            Calculation.id == calc_id,
             Calculation.user_id == current_user.id,
         )
-        .first()
     )
 
     if not calc:
@@ -262,19 +369,17 @@ def get_calculation(
     response_model=CalculationResponse,
     tags=["calculations"],
 )
-def update_calculation(
-    calc_id: str,
+async def update_calculation(
+    calc_id: UUID,
     update: CalculationUpdate,
     current_user=Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    calc = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == UUID(calc_id),
+    calc = await db.scalar(
+        select(Calculation).where(
+            Calculation.id == calc_id,
             Calculation.user_id == current_user.id,
         )
-        .first()
     )
 
     if not calc:
@@ -285,8 +390,8 @@ def update_calculation(
         calc.result = calc.get_result()
 
     calc.updated_at = datetime.utcnow()
-    db.commit()
-    db.refresh(calc)
+    await db.commit()
+    await invalidate_usage_report(current_user.id)
     return calc
 
 
@@ -295,34 +400,35 @@ def update_calculation(
     status_code=status.HTTP_204_NO_CONTENT,
     tags=["calculations"],
 )
-def delete_calculation(
-    calc_id: str,
+async def delete_calculation(
+    calc_id: UUID,
     current_user=Depends(get_current_active_user),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    calc = (
-        db.query(Calculation)
-        .filter(
-            Calculation.id == UUID(calc_id),
+    calc = await db.scalar(
+        select(Calculation).where(
+            Calculation.id == calc_id,
             Calculation.user_id == current_user.id,
         )
-        .first()
     )
 
     if not calc:
         raise HTTPException(status_code=404, detail="Not found")
 
-    db.delete(calc)
-    db.commit()
+    await db.delete(calc)
+    await db.commit()
+    await invalidate_usage_report(current_user.id)
 
 
 # ------------------------------------------------------------------------------
 # Run
 # ------------------------------------------------------------------------------
 if __name__ == "__main__":
+    # Worker count from WEB_CONCURRENCY (default 4, see Settings).
+    # Use `uvicorn app.main:app --reload` for local auto-reload instead.
     uvicorn.run(
         "app.main:app",
         host="127.0.0.1",
         port=8001,
-        reload=True,
+        workers=settings.WEB_CONCURRENCY,
     )
@@ -13,7 +13,7 @@ router = APIRouter(prefix="/calculations", tags=["Calculations"])
 @router.get("/", response_model=List[CalculationResponse])
 def list_calculations(
     type: Optional[str] = Query(None, description="Filter by calculation type"),
-    sort: str = Query("desc", regex="^(asc|desc)$"),
+    sort: str = Query("desc", pattern="^(asc|desc)$"),
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user),
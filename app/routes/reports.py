@@ -1,17 +1,87 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+import json
+import logging
+from uuid import uuid4
 
-from app.database import get_db
+from fastapi import APIRouter, Depends, Request, Response, status
+from redis.exceptions import RedisError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+
+from app.database import get_async_db
 from app.models.calculation import Calculation
 from app.auth.dependencies import get_current_active_user
+from app.auth.redis import get_redis
+from app.core.config import get_settings
+from app.core.http_cache import etag_matches
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/reports", tags=["Reports"])
 
+# Lifetime of a user's write-version token; a missing token is simply
+# re-minted, which only costs clients one full response.
+USAGE_VERSION_TTL = 24 * 60 * 60
+USAGE_CACHE_CONTROL = "private, no-cache"
+
+
+def usage_cache_key(user_id) -> str:
+    """Redis key holding a user's cached usage report."""
+    return f"usage:{user_id}"
+
+
+def usage_version_key(user_id) -> str:
+    """Redis key holding a user's write-version token (the report's ETag)."""
+    return f"usage_version:{user_id}"
+
+
+def usage_etag(user_id, version: str) -> str:
+    return f'W/"usage-{user_id}-{version}"'
+
+
+async def get_usage_cache():
+    """The Redis client backing the report cache, or None when REDIS_URL is unset."""
+    if not settings.REDIS_URL:
+        return None
+    return await get_redis()
+
+
+async def invalidate_usage_report(user_id) -> None:
+    """
+    Drop a user's cached usage report after their calculations change and
+    replace their write-version token so previously issued ETags stop matching.
+
+    Tokens are random rather than a counter so that a Redis flush can never
+    hand out an ETag a client already holds for older data.
+    """
+    try:
+        redis_client = await get_usage_cache()
+        if redis_client is None:
+            return
+        async with redis_client.pipeline(transaction=False) as pipe:
+            pipe.delete(usage_cache_key(user_id))
+            pipe.set(usage_version_key(user_id), uuid4().hex, ex=USAGE_VERSION_TTL)
+            await pipe.execute()
+    except RedisError as e:
+        logger.warning(f"Could not invalidate usage report cache: {e}")
+
+
+async def _get_usage_version(redis_client, user_id, version):
+    """Return the user's write-version token, minting one if none exists."""
+    if version is not None:
+        return version
+    version = uuid4().hex
+    key = usage_version_key(user_id)
+    if await redis_client.set(key, version, ex=USAGE_VERSION_TTL, nx=True):
+        return version
+    return await redis_client.get(key)
+
 
 @router.get("/usage")
-def calculation_usage_report(
-    db: Session = Depends(get_db),
+async def calculation_usage_report(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     current_user = Depends(get_current_active_user),
 ):
     """
@@ -19,25 +89,83 @@ def calculation_usage_report(
     - Total calculations
     - Count by type
     - Average result
+
+    Responses are cached per user in Redis and invalidated whenever the
+    user's calculations are created, updated or deleted. If REDIS_URL is
+    unset or Redis is unavailable the report is computed from the database
+    as usual.
+
+    The ETag is the user's write-version token, so a client revalidating
+    with If-None-Match gets a 304 without the report being read or
+    recomputed. Without Redis no ETag is sent.
     """
+    key = usage_cache_key(current_user.id)
+    cached, version = None, None
+    try:
+        redis_client = await get_usage_cache()
+        if redis_client is not None:
+            cached, version = await redis_client.mget(
+                key, usage_version_key(current_user.id)
+            )
+            version = await _get_usage_version(redis_client, current_user.id, version)
+    except RedisError as e:
+        logger.warning(f"Usage report cache unavailable: {e}")
+        cached, version = None, None
+
+    response.headers["Cache-Control"] = USAGE_CACHE_CONTROL
+    if version is not None:
+        etag = usage_etag(current_user.id, version)
+        if etag_matches(request, etag):
+            return Response(
+                status_code=status.HTTP_304_NOT_MODIFIED,
+                headers={"ETag": etag, "Cache-Control": USAGE_CACHE_CONTROL},
+            )
+        response.headers["ETag"] = etag
 
-    total = db.query(func.count(Calculation.id)).filter(
-        Calculation.user_id == current_user.id
-    ).scalar()
+    # The cached body records the version it was computed under. A reader
+    # that started before a write may store its report after the write
+    # bumped the version; that entry must not be served under the new ETag.
+    if cached is not None:
+        cached = json.loads(cached)
+        if cached.get("version") == version:
+            return cached["report"]
 
-    by_type = (
-        db.query(Calculation.type, func.count(Calculation.id))
-        .filter(Calculation.user_id == current_user.id)
-        .group_by(Calculation.type)
-        .all()
-    )
+    # One round trip: per-type counts plus the pieces needed for the
+    # overall total and average, which are reduced in Python below.
+    # Every column used is in ix_calc_user_type, so Postgres can answer
+    # this from the index alone.
+    rows = (
+        await db.execute(
+            select(
+                Calculation.type,
+                func.count(),
+                func.count(Calculation.result),
+                func.sum(Calculation.result),
+            )
+            .where(Calculation.user_id == current_user.id)
+            .group_by(Calculation.type)
+        )
+    ).all()
 
-    avg_result = db.query(func.avg(Calculation.result)).filter(
-        Calculation.user_id == current_user.id
-    ).scalar()
+    total = sum(count for _, count, _, _ in rows)
+    result_count = sum(n for _, _, n, _ in rows)
+    result_sum = sum(s for _, _, _, s in rows if s is not None)
+    avg_result = result_sum / result_count if result_count else None
 
-    return {
+    report = {
         "total_calculations": total,
-        "by_type": {t: c for t, c in by_type},
+        "by_type": {t: c for t, c, _, _ in rows},
         "average_result": round(avg_result, 2) if avg_result is not None else None,
     }
+
+    if version is not None:
+        try:
+            await redis_client.set(
+                key,
+                json.dumps({"version": version, "report": report}),
+                ex=settings.USAGE_REPORT_CACHE_TTL,
+            )
+        except RedisError as e:
+            logger.warning(f"Could not cache usage report: {e}")
+
+    return report
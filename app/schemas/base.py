@@ -3,10 +3,10 @@ from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
 
 class UserBase(BaseModel):
     """Base user schema with common fields."""
-    first_name: str = Field(max_length=50, example="John")
-    last_name: str = Field(max_length=50, example="Doe")
-    email: EmailStr = Field(example="john.doe@example.com")
-    username: str = Field(min_length=3, max_length=50, example="johndoe")
+    first_name: str = Field(max_length=50, examples=["John"])
+    last_name: str = Field(max_length=50, examples=["Doe"])
+    email: EmailStr = Field(examples=["john.doe@example.com"])
+    username: str = Field(min_length=3, max_length=50, examples=["johndoe"])
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -14,7 +14,7 @@ class PasswordMixin(BaseModel):
     password: str = Field(
         ...,
         min_length=8,
-        example="SecurePass123!",
+        examples=["SecurePass123!"],
         description="Password"
     )
 
@@ -43,5 +43,5 @@ class UserLogin(BaseModel):
     Schema for user login credentials.
     Contains the username and password.
     """
-    username: str = Field(min_length=3, max_length=50, example="johndoe")
-    password: str = Field(min_length=8, example="supersecretpassword")
+    username: str = Field(min_length=3, max_length=50, examples=["johndoe"])
+    password: str = Field(min_length=8, examples=["supersecretpassword"])
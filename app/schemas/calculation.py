@@ -50,13 +50,13 @@ class CalculationBase(BaseModel):
     type: CalculationType = Field(
         ...,  # The ... means this field is required
         description="Type of calculation (addition, subtraction, multiplication, division)",
-        example="addition"
+        examples=["addition"]
     )
     inputs: List[float] = Field(
         ...,  # The ... means this field is required
         description="List of numeric inputs for the calculation",
-        example=[10.5, 3, 2],
-        min_items=2  # Ensures at least 2 numbers are provided
+        examples=[[10.5, 3, 2]],
+        min_length=2  # Ensures at least 2 numbers are provided
     )
 
     @field_validator("type", mode="before")
@@ -156,7 +156,7 @@ class CalculationCreate(CalculationBase):
     user_id: UUID = Field(
         ...,
         description="UUID of the user who owns this calculation",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
 
     model_config = ConfigDict(
@@ -183,8 +183,8 @@ class CalculationUpdate(BaseModel):
     inputs: Optional[List[float]] = Field(
         None,  # None means this field is optional
         description="Updated list of numeric inputs for the calculation",
-        example=[42, 7],
-        min_items=2  # If provided, at least 2 items are required
+        examples=[[42, 7]],
+        min_length=2  # If provided, at least 2 items are required
     )
 
     @model_validator(mode='after')
@@ -226,19 +226,18 @@ class CalculationResponse(CalculationBase):
     
     This schema is used for:
     - GET /calculations/{id} (single calculation)
-    - GET /calculations (list of calculations)
     - POST /calculations (creation response)
     - PUT /calculations/{id} (update response)
     """
     id: UUID = Field(
         ...,
         description="Unique UUID of the calculation",
-        example="123e4567-e89b-12d3-a456-426614174999"
+        examples=["123e4567-e89b-12d3-a456-426614174999"]
     )
     user_id: UUID = Field(
         ...,
         description="UUID of the user who owns this calculation",
-        example="123e4567-e89b-12d3-a456-426614174000"
+        examples=["123e4567-e89b-12d3-a456-426614174000"]
     )
     created_at: datetime = Field(
         ..., 
@@ -251,7 +250,7 @@ class CalculationResponse(CalculationBase):
     result: float = Field(
         ...,
         description="Result of the calculation",
-        example=15.5
+        examples=[15.5]
     )
 
     model_config = ConfigDict(
@@ -271,3 +270,37 @@ class CalculationResponse(CalculationBase):
             }
         }
     )
+
+class CalculationListItem(BaseModel):
+    """
+    Schema for one row of the calculation history list.
+
+    This is a narrow projection of CalculationResponse with only the columns
+    the history view renders. It is built straight from selected columns
+    rather than ORM instances, and it skips the input validators of
+    CalculationBase since the values come from the database.
+    """
+    id: UUID = Field(..., description="Unique UUID of the calculation")
+    type: str = Field(..., description="Type of calculation", examples=["addition"])
+    inputs: List[float] = Field(..., description="Inputs of the calculation")
+    result: float = Field(..., description="Result of the calculation", examples=[15.5])
+    created_at: datetime = Field(..., description="Time when the calculation was created")
+
+    model_config = ConfigDict(from_attributes=True)
+
+class CalculationPage(BaseModel):
+    """
+    Schema for one page of a user's calculation history.
+
+    Pages are ordered newest first. To fetch the next page, pass
+    next_cursor back as the cursor query parameter; it is None on the
+    last page.
+    """
+    items: List[CalculationListItem] = Field(
+        ...,
+        description="Calculations on this page, newest first"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Opaque cursor for the next page, or None if there are no more pages"
+    )
@@ -1,21 +1,31 @@
+import os
 import socket
 import subprocess
 import time
 import logging
+from uuid import uuid4
 from typing import Generator, Dict, List
 from contextlib import contextmanager
 
 import pytest
 import requests
 from faker import Faker
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from playwright.sync_api import sync_playwright, Browser, Page
 
+# Use bcrypt's minimum cost for tests; must be set before app settings load.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
 from app.database import Base, get_engine, get_sessionmaker
 from app.models.user import User
+from app.models.calculation import Calculation
 from app.core.config import settings
 from app.database_init import init_db, drop_db
+from app.main import app
+from app.routes.reports import invalidate_usage_report
 
 # ======================================================================================
 # Logging Configuration
@@ -158,6 +168,68 @@ def seed_users(db_session: Session, request) -> List[User]:
     logger.info(f"Seeded {len(users)} users.")
     return users
 
+@pytest.fixture
+def seed_calcs(client: TestClient, db_session: Session, test_user: User):
+    """
+    Return a helper that bulk-inserts calculations for test_user in one
+    executemany, bypassing the HTTP API. Each row needs "type" and "inputs";
+    the result is computed by the model unless given.
+
+    The user's cached usage report is dropped afterwards, as the API write
+    path would do.
+    """
+    def _make(rows: List[Dict]) -> None:
+        db_session.execute(insert(Calculation), [
+            {
+                "user_id": test_user.id,
+                "result": Calculation.create(row["type"], test_user.id, row["inputs"]).result,
+                **row,
+            }
+            for row in rows
+        ])
+        db_session.commit()
+        client.portal.call(invalidate_usage_report, test_user.id)
+    return _make
+
+# ======================================================================================
+# API Client Fixtures
+# ======================================================================================
+@pytest.fixture(scope="session")
+def client() -> Generator[TestClient, None, None]:
+    """
+    Provide one TestClient for the whole session. Entering it runs the app
+    lifespan once and keeps every request on a single event loop, which the
+    pooled async database connections require.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+@pytest.fixture(scope="module")
+def auth_headers(client: TestClient) -> Dict[str, str]:
+    """
+    Register and log in one user per test module and return its bearer
+    Authorization header. Tests that need an empty account should register
+    their own user instead.
+    """
+    suffix = uuid4().hex[:12]
+    user_data = {
+        "first_name": "Module",
+        "last_name": "User",
+        "email": f"module_{suffix}@example.com",
+        "username": f"module_{suffix}",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!"
+    }
+    reg_resp = client.post("/auth/register", json=user_data)
+    assert reg_resp.status_code == 201, f"Registration failed: {reg_resp.text}"
+
+    login_resp = client.post(
+        "/auth/login",
+        json={"username": user_data["username"], "password": user_data["password"]}
+    )
+    assert login_resp.status_code == 200, f"Login failed: {login_resp.text}"
+    return {"Authorization": f"Bearer {login_resp.json()['access_token']}"}
+
 # ======================================================================================
 # FastAPI Server Fixture
 # ======================================================================================
@@ -1,12 +1,12 @@
 from datetime import datetime, timezone
 from uuid import uuid4
 import pytest
+from anyio import to_thread
 from fastapi.testclient import TestClient
 
-from app.main import app
+from app.core.config import get_settings
 from app.models.calculation import Calculation
-
-client = TestClient(app)
+from app.models.user import User
 
 # =============================================================================
 # Fixtures & Helpers
@@ -20,7 +20,7 @@ def _parse_datetime(dt_str: str) -> datetime:
     return datetime.fromisoformat(dt_str)
 
 
-def register_and_login(user_data: dict) -> dict:
+def register_and_login(client: TestClient, user_data: dict) -> dict:
     """
     Registers a new user and logs in.
     Returns the login token payload.
@@ -42,13 +42,20 @@ def register_and_login(user_data: dict) -> dict:
 # Health & Authentication Tests
 # =============================================================================
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     resp = client.get("/health")
     assert resp.status_code == 200
     assert resp.json() == {"status": "ok"}
 
 
-def test_user_registration_and_login():
+def test_threadpool_is_sized_from_settings(client):
+    async def total_tokens():
+        return to_thread.current_default_thread_limiter().total_tokens
+
+    assert client.portal.call(total_tokens) == get_settings().THREADPOOL_TOKENS
+
+
+def test_user_registration_and_login(client):
     user = {
         "first_name": "Alice",
         "last_name": "Tester",
@@ -58,7 +65,7 @@ def test_user_registration_and_login():
         "confirm_password": "SecurePass123!"
     }
 
-    token_data = register_and_login(user)
+    token_data = register_and_login(client, user)
 
     required_fields = [
         "access_token",
@@ -84,132 +91,93 @@ def test_user_registration_and_login():
     assert expires_at > datetime.now(timezone.utc)
 
 
+@pytest.mark.parametrize("path", ["/", "/login", "/register", "/dashboard"])
+def test_static_pages_support_etag_revalidation(client, path):
+    resp = client.get(path)
+    assert resp.status_code == 200
+    assert resp.headers["cache-control"] == "public, max-age=300"
+    assert "last-modified" in resp.headers
+    etag = resp.headers["etag"]
+
+    not_modified = client.get(path, headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.headers["etag"] == etag
+    assert not_modified.content == b""
+
+    assert client.get(path, headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
 # =============================================================================
 # Calculation CRUD Integration Tests
 # =============================================================================
 
-def test_create_calculation_addition():
-    user = {
-        "first_name": "Calc",
-        "last_name": "Adder",
-        "email": f"add{uuid4()}@example.com",
-        "username": f"adder_{uuid4()}",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!"
-    }
-    token = register_and_login(user)["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_create_calculation_addition(client, auth_headers):
     payload = {
         "type": "addition",
         "inputs": [10, 5, 2]
     }
 
-    resp = client.post("/calculations", json=payload, headers=headers)
+    resp = client.post("/calculations", json=payload, headers=auth_headers)
     assert resp.status_code == 201
     assert resp.json()["result"] == 17
 
 
-def test_create_calculation_subtraction():
-    user = {
-        "first_name": "Calc",
-        "last_name": "Sub",
-        "email": f"sub{uuid4()}@example.com",
-        "username": f"sub_{uuid4()}",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!"
-    }
-    token = register_and_login(user)["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_create_calculation_subtraction(client, auth_headers):
     payload = {
         "type": "subtraction",
         "inputs": [10, 3, 2]
     }
 
-    resp = client.post("/calculations", json=payload, headers=headers)
+    resp = client.post("/calculations", json=payload, headers=auth_headers)
     assert resp.status_code == 201
     assert resp.json()["result"] == 5
 
 
-def test_create_calculation_multiplication():
-    user = {
-        "first_name": "Calc",
-        "last_name": "Mult",
-        "email": f"mult{uuid4()}@example.com",
-        "username": f"mult_{uuid4()}",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!"
-    }
-    token = register_and_login(user)["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_create_calculation_multiplication(client, auth_headers):
     payload = {
         "type": "multiplication",
         "inputs": [2, 3, 4]
     }
 
-    resp = client.post("/calculations", json=payload, headers=headers)
+    resp = client.post("/calculations", json=payload, headers=auth_headers)
     assert resp.status_code == 201
     assert resp.json()["result"] == 24
 
 
-def test_create_calculation_division():
-    user = {
-        "first_name": "Calc",
-        "last_name": "Div",
-        "email": f"div{uuid4()}@example.com",
-        "username": f"div_{uuid4()}",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!"
-    }
-    token = register_and_login(user)["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_create_calculation_division(client, auth_headers):
     payload = {
         "type": "division",
         "inputs": [100, 2, 5]
     }
 
-    resp = client.post("/calculations", json=payload, headers=headers)
+    resp = client.post("/calculations", json=payload, headers=auth_headers)
     assert resp.status_code == 201
     assert resp.json()["result"] == 10
 
 
-def test_list_get_update_delete_calculation():
-    user = {
-        "first_name": "Calc",
-        "last_name": "CRUD",
-        "email": f"crud{uuid4()}@example.com",
-        "username": f"crud_{uuid4()}",
-        "password": "SecurePass123!",
-        "confirm_password": "SecurePass123!"
-    }
-    token = register_and_login(user)["access_token"]
-    headers = {"Authorization": f"Bearer {token}"}
-
+def test_list_get_update_delete_calculation(client, auth_headers):
     # Create
     create_resp = client.post(
         "/calculations",
         json={"type": "multiplication", "inputs": [3, 4]},
-        headers=headers
+        headers=auth_headers
     )
     assert create_resp.status_code == 201
     calc_id = create_resp.json()["id"]
 
     # List
-    list_resp = client.get("/calculations", headers=headers)
-    assert any(c["id"] == calc_id for c in list_resp.json())
+    list_resp = client.get("/calculations", headers=auth_headers)
+    assert any(c["id"] == calc_id for c in list_resp.json()["items"])
 
     # Get
-    get_resp = client.get(f"/calculations/{calc_id}", headers=headers)
+    get_resp = client.get(f"/calculations/{calc_id}", headers=auth_headers)
     assert get_resp.status_code == 200
 
     # Update
     update_resp = client.put(
         f"/calculations/{calc_id}",
         json={"inputs": [5, 6]},
-        headers=headers
+        headers=auth_headers
     )
     assert update_resp.status_code == 200
     assert update_resp.json()["result"] == 30
@@ -217,15 +185,120 @@ def test_list_get_update_delete_calculation():
     # Delete
     delete_resp = client.delete(
         f"/calculations/{calc_id}",
-        headers=headers
+        headers=auth_headers
     )
     assert delete_resp.status_code == 204
 
     # Confirm deletion
-    confirm_resp = client.get(f"/calculations/{calc_id}", headers=headers)
+    confirm_resp = client.get(f"/calculations/{calc_id}", headers=auth_headers)
     assert confirm_resp.status_code == 404
 
 
+def test_list_calculations_paginates_with_cursor(client):
+    user = {
+        "first_name": "Calc",
+        "last_name": "Pager",
+        "email": f"pager{uuid4()}@example.com",
+        "username": f"pager_{uuid4()}",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!"
+    }
+    token = register_and_login(client, user)["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    created = []
+    for i in range(3):
+        resp = client.post(
+            "/calculations",
+            json={"type": "addition", "inputs": [i, 1]},
+            headers=headers
+        )
+        created.append(resp.json()["id"])
+
+    first = client.get("/calculations", params={"limit": 2}, headers=headers).json()
+    assert [c["id"] for c in first["items"]] == created[:0:-1]
+    assert set(first["items"][0]) == {"id", "type", "inputs", "result", "created_at"}
+    assert first["next_cursor"] is not None
+
+    second = client.get(
+        "/calculations",
+        params={"limit": 2, "cursor": first["next_cursor"]},
+        headers=headers
+    ).json()
+    assert [c["id"] for c in second["items"]] == created[:1]
+    assert second["next_cursor"] is None
+
+
+def test_list_calculations_pages_through_duplicate_timestamps(client, db_session, test_user):
+    created_at = datetime(2030, 1, 1)
+    calcs = [
+        Calculation.create("addition", test_user.id, [i, 1]) for i in range(5)
+    ]
+    for calc in calcs:
+        calc.created_at = created_at
+    db_session.add_all(calcs)
+    db_session.commit()
+
+    token = User.create_access_token({"sub": str(test_user.id)})
+    headers = {"Authorization": f"Bearer {token}"}
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 2, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/calculations", params=params, headers=headers).json()
+        seen += [c["id"] for c in page["items"]]
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(seen) == sorted(str(c.id) for c in calcs)
+    assert len(seen) == len(set(seen))
+
+
+def test_list_calculations_rejects_malformed_cursor(client, auth_headers):
+    for cursor in ["2030-01-01T00:00:00Z", "not base64!", "Zm9v"]:
+        resp = client.get("/calculations", params={"cursor": cursor}, headers=auth_headers)
+        assert resp.status_code == 422
+
+
+def test_list_calculations_is_gzip_compressed(client):
+    user = {
+        "first_name": "Calc",
+        "last_name": "Gzip",
+        "email": f"gzip{uuid4()}@example.com",
+        "username": f"gzip_{uuid4()}",
+        "password": "SecurePass123!",
+        "confirm_password": "SecurePass123!"
+    }
+    token = register_and_login(client, user)["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+
+    for i in range(5):
+        client.post(
+            "/calculations",
+            json={"type": "addition", "inputs": [i, 1]},
+            headers=headers
+        )
+
+    resp = client.get(
+        "/calculations",
+        headers={**headers, "Accept-Encoding": "gzip"}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-encoding"] == "gzip"
+    assert len(resp.json()["items"]) == 5
+
+
+def test_calculation_endpoints_reject_malformed_id(client, auth_headers):
+    assert client.get("/calculations/not-a-uuid", headers=auth_headers).status_code == 422
+    assert client.put(
+        "/calculations/not-a-uuid",
+        json={"inputs": [1, 2]},
+        headers=auth_headers
+    ).status_code == 422
+    assert client.delete("/calculations/not-a-uuid", headers=auth_headers).status_code == 422
+
+
 # =============================================================================
 # Unit Tests (Model-Level)
 # =============================================================================
@@ -116,6 +116,28 @@ def test_calculation_factory_division():
     assert isinstance(calc, Division), "Factory did not return a Division instance."
     assert calc.get_result() == 10, "Incorrect division result."
 
+def test_calculation_factory_computes_result():
+    """
+    Test that Calculation.create stores the computed result on the instance.
+    """
+    calc = Calculation.create(
+        calculation_type='subtraction',
+        user_id=dummy_user_id(),
+        inputs=[10, 4, 1],
+    )
+    assert calc.result == 5, "Factory did not compute the result."
+
+def test_calculation_factory_division_by_zero():
+    """
+    Test that Calculation.create rejects division by zero up front.
+    """
+    with pytest.raises(ValueError, match="Cannot divide by zero."):
+        Calculation.create(
+            calculation_type='division',
+            user_id=dummy_user_id(),
+            inputs=[10, 2, 0],
+        )
+
 def test_calculation_factory_invalid_type():
     """
     Test that Calculation.create raises a ValueError for an unsupported calculation type.
@@ -53,3 +53,17 @@ def test_get_sessionmaker(mock_settings):
     engine = database.get_engine()
     SessionLocal = database.get_sessionmaker(engine)
     assert isinstance(SessionLocal, sessionmaker)
+
+def test_get_pool_sizes_splits_connection_budget(monkeypatch):
+    """Test that per-worker pools share DB_MAX_CONNECTIONS across workers."""
+    database = importlib.import_module(DATABASE_MODULE)
+    monkeypatch.setattr(database.settings, "DB_MAX_CONNECTIONS", 90)
+    monkeypatch.setattr(database.settings, "WEB_CONCURRENCY", 4)
+    monkeypatch.setattr(database.settings, "DB_POOL_SIZE", None)
+    monkeypatch.setattr(database.settings, "DB_ASYNC_POOL_SIZE", None)
+    sync_size, async_size = database.get_pool_sizes()
+    assert (sync_size, async_size) == (5, 17)
+    assert (sync_size + async_size) * 4 <= 90
+
+    monkeypatch.setattr(database.settings, "DB_POOL_SIZE", 2)
+    assert database.get_pool_sizes() == (2, 20)
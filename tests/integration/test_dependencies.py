@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import patch
 from fastapi import HTTPException, status
@@ -42,7 +43,7 @@ def mock_verify_token():
 def test_get_current_user_valid_token_existing_user(mock_verify_token):
     mock_verify_token.return_value = sample_user_data
 
-    user_response = get_current_user(token="validtoken")
+    user_response = asyncio.run(get_current_user(token="validtoken"))
 
     assert isinstance(user_response, UserResponse)
     assert user_response.id == sample_user_data["id"]
@@ -62,7 +63,7 @@ def test_get_current_user_invalid_token(mock_verify_token):
     mock_verify_token.return_value = None
 
     with pytest.raises(HTTPException) as exc_info:
-        get_current_user(token="invalidtoken")
+        asyncio.run(get_current_user(token="invalidtoken"))
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == "Could not validate credentials"
@@ -75,7 +76,7 @@ def test_get_current_user_valid_token_incomplete_payload(mock_verify_token):
     mock_verify_token.return_value = {}
 
     with pytest.raises(HTTPException) as exc_info:
-        get_current_user(token="validtoken")
+        asyncio.run(get_current_user(token="validtoken"))
 
     assert exc_info.value.status_code == status.HTTP_401_UNAUTHORIZED
     assert exc_info.value.detail == "Could not validate credentials"
@@ -86,8 +87,8 @@ def test_get_current_user_valid_token_incomplete_payload(mock_verify_token):
 def test_get_current_active_user_active(mock_verify_token):
     mock_verify_token.return_value = sample_user_data
 
-    current_user = get_current_user(token="validtoken")
-    active_user = get_current_active_user(current_user=current_user)
+    current_user = asyncio.run(get_current_user(token="validtoken"))
+    active_user = asyncio.run(get_current_active_user(current_user=current_user))
 
     assert isinstance(active_user, UserResponse)
     assert active_user.is_active is True
@@ -96,10 +97,10 @@ def test_get_current_active_user_active(mock_verify_token):
 def test_get_current_active_user_inactive(mock_verify_token):
     mock_verify_token.return_value = inactive_user_data
 
-    current_user = get_current_user(token="validtoken")
+    current_user = asyncio.run(get_current_user(token="validtoken"))
 
     with pytest.raises(HTTPException) as exc_info:
-        get_current_active_user(current_user=current_user)
+        asyncio.run(get_current_active_user(current_user=current_user))
 
     assert exc_info.value.status_code == status.HTTP_400_BAD_REQUEST
     assert exc_info.value.detail == "Inactive user"
@@ -3,17 +3,64 @@ Integration tests for the Reports feature.
 Tests the /reports/usage endpoint with database interactions.
 """
 import pytest
+from unittest.mock import patch
 from fastapi.testclient import TestClient
+from redis.exceptions import ConnectionError as RedisConnectionError
 from sqlalchemy.orm import Session
 
-from app.main import app
 from app.models.user import User
 from app.models.calculation import Calculation
 
-client = TestClient(app)
 
+class FakeRedis:
+    """Minimal in-memory stand-in for the async Redis client."""
 
-def test_usage_report_no_calculations(db_session: Session, test_user: User):
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def mget(self, *keys):
+        return [self.store.get(key) for key in keys]
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    async def delete(self, key):
+        self.store.pop(key, None)
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Buffers commands and runs them against a FakeRedis on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def delete(self, *args, **kwargs):
+        self.commands.append(self.redis.delete(*args, **kwargs))
+
+    def set(self, *args, **kwargs):
+        self.commands.append(self.redis.set(*args, **kwargs))
+
+    async def execute(self):
+        return [await command for command in self.commands]
+
+
+def test_usage_report_no_calculations(client: TestClient, db_session: Session, test_user: User):
     """Test usage report when user has no calculations."""
     access_token = User.create_access_token({"sub": str(test_user.id)})
     
@@ -29,7 +76,7 @@ def test_usage_report_no_calculations(db_session: Session, test_user: User):
     assert data["average_result"] is None
 
 
-def test_usage_report_with_calculations(db_session: Session, test_user: User):
+def test_usage_report_with_calculations(client: TestClient, db_session: Session, test_user: User):
     """Test usage report with multiple calculations."""
     access_token = User.create_access_token({"sub": str(test_user.id)})
     
@@ -59,13 +106,13 @@ def test_usage_report_with_calculations(db_session: Session, test_user: User):
     assert data["average_result"] == 11.75
 
 
-def test_usage_report_unauthorized(db_session: Session):
+def test_usage_report_unauthorized(client: TestClient, db_session: Session):
     """Test usage report without authentication."""
     response = client.get("/reports/usage")
     assert response.status_code == 401
 
 
-def test_usage_report_only_shows_user_calculations(db_session: Session, test_user: User):
+def test_usage_report_only_shows_user_calculations(client: TestClient, db_session: Session, test_user: User):
     """Test that usage report only includes current user's calculations."""
     # Create another user
     other_user = User(
@@ -106,3 +153,116 @@ def test_usage_report_only_shows_user_calculations(db_session: Session, test_use
     # Should only see test_user's calculation
     assert data["total_calculations"] == 1
     assert data["average_result"] == 2.0
+
+
+def test_usage_report_is_cached_and_invalidated_on_write(client: TestClient, db_session: Session, test_user: User):
+    """Test that the report is served from cache until the user writes a calculation."""
+    fake_redis = FakeRedis()
+    access_token = User.create_access_token({"sub": str(test_user.id)})
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    db_session.add(Calculation(user_id=test_user.id, type="addition", inputs=[1, 1], result=2))
+    db_session.commit()
+
+    with patch("app.routes.reports.get_usage_cache", return_value=fake_redis):
+        response = client.get("/reports/usage", headers=headers)
+        assert response.json()["total_calculations"] == 1
+        assert f"usage:{test_user.id}" in fake_redis.store
+
+        # Rows written behind the API's back are not seen until invalidation
+        db_session.add(Calculation(user_id=test_user.id, type="addition", inputs=[2, 2], result=4))
+        db_session.commit()
+        response = client.get("/reports/usage", headers=headers)
+        assert response.json()["total_calculations"] == 1
+
+        # Creating a calculation through the API drops the cached report
+        client.post("/calculations", json={"type": "addition", "inputs": [3, 3]}, headers=headers)
+        assert f"usage:{test_user.id}" not in fake_redis.store
+
+        response = client.get("/reports/usage", headers=headers)
+        data = response.json()
+        assert data["total_calculations"] == 3
+        assert data["average_result"] == 4.0
+
+
+def test_usage_report_etag_revalidation(client: TestClient, db_session: Session, test_user: User):
+    """Test that If-None-Match gets a 304 until the user writes a calculation."""
+    fake_redis = FakeRedis()
+    access_token = User.create_access_token({"sub": str(test_user.id)})
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    with patch("app.routes.reports.get_usage_cache", return_value=fake_redis):
+        response = client.get("/reports/usage", headers=headers)
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "private, no-cache"
+        etag = response.headers["etag"]
+        assert str(test_user.id) in etag
+
+        response = client.get("/reports/usage", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["etag"] == etag
+        assert response.content == b""
+
+        client.post("/calculations", json={"type": "addition", "inputs": [1, 2]}, headers=headers)
+
+        response = client.get("/reports/usage", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+        assert response.json()["total_calculations"] == 1
+
+
+def test_usage_report_without_redis_sends_no_etag(client: TestClient, test_user: User):
+    """Test that no ETag is issued when there is no write-version to tie it to."""
+    access_token = User.create_access_token({"sub": str(test_user.id)})
+
+    with patch("app.routes.reports.get_usage_cache", side_effect=RedisConnectionError("down")):
+        response = client.get(
+            "/reports/usage",
+            headers={"Authorization": f"Bearer {access_token}", "If-None-Match": "*"}
+        )
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+
+
+def test_usage_report_ignores_cache_entry_from_older_version(client: TestClient, db_session: Session, test_user: User):
+    """Test that a report cached under a superseded version is recomputed."""
+    fake_redis = FakeRedis()
+    access_token = User.create_access_token({"sub": str(test_user.id)})
+    headers = {"Authorization": f"Bearer {access_token}"}
+
+    db_session.add(Calculation(user_id=test_user.id, type="addition", inputs=[1, 1], result=2))
+    db_session.commit()
+
+    with patch("app.routes.reports.get_usage_cache", return_value=fake_redis):
+        # A slow reader stored a stale report under an old version after a
+        # write had already bumped it
+        fake_redis.store[f"usage_version:{test_user.id}"] = "new"
+        fake_redis.store[f"usage:{test_user.id}"] = (
+            '{"version": "old", "report": {"total_calculations": 0, "by_type": {}, "average_result": null}}'
+        )
+
+        response = client.get("/reports/usage", headers=headers)
+        assert response.json()["total_calculations"] == 1
+        assert '"version": "new"' in fake_redis.store[f"usage:{test_user.id}"]
+
+
+def test_usage_report_skips_redis_when_unconfigured(client: TestClient, test_user: User):
+    """Test that no Redis call is made for the report when REDIS_URL is unset."""
+    access_token = User.create_access_token({"sub": str(test_user.id)})
+
+    with patch("app.routes.reports.settings.REDIS_URL", None), \
+            patch("app.routes.reports.get_redis") as get_redis:
+        response = client.get(
+            "/reports/usage",
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+        client.post(
+            "/calculations",
+            json={"type": "addition", "inputs": [1, 2]},
+            headers={"Authorization": f"Bearer {access_token}"}
+        )
+
+    assert response.status_code == 200
+    assert "etag" not in response.headers
+    get_redis.assert_not_called()
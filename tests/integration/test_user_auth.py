@@ -1,10 +1,13 @@
 # tests/integration/test_user_auth.py
 
+import os
 import pytest
+from concurrent.futures.process import BrokenProcessPool
 from uuid import UUID
 import pydantic_core
 from sqlalchemy.exc import IntegrityError
 from app.models.user import User
+from app.auth import hashing
 
 def test_password_hashing(db_session, fake_user_data):
     """Test password hashing and verification functionality"""
@@ -23,6 +26,28 @@ def test_password_hashing(db_session, fake_user_data):
     assert user.verify_password("WrongPass123") is False
     assert hashed != original_password
 
+def test_password_hashing_on_process_pool():
+    """Test that pool-computed hashes match the in-process bcrypt context"""
+    hashed = hashing.hash_password("TestPass123")
+
+    assert hashing.get_hash_pool() is not None
+    assert hashing.pwd_context.verify("TestPass123", hashed) is True
+    assert hashing.verify_password("TestPass123", hashed) is True
+    assert hashing.verify_password("WrongPass123", hashed) is False
+
+def test_password_hashing_recovers_from_broken_pool():
+    """Test that a dead hashing child does not fail every later call"""
+    pool = hashing.get_hash_pool()
+    with pytest.raises(BrokenProcessPool):
+        pool.submit(os._exit, 1).result()
+
+    hashed = hashing.hash_password("TestPass123")
+    assert hashing.pwd_context.verify("TestPass123", hashed) is True
+
+    new_pool = hashing.get_hash_pool()
+    assert new_pool is not pool
+    assert hashing.verify_password("TestPass123", hashed) is True
+
 def test_user_registration(db_session, fake_user_data):
     """Test user registration process"""
     fake_user_data['password'] = "TestPass123"